@@ -47,29 +47,41 @@ export async function executeWorkflow(workflow: Workflow): Promise<void> {
     // 2. COLLECT MARKET DATA (Weighted Intelligence)
     console.log('\n📊 Gathering Intel...');
     const marketData: MarketData = { prices: {} };
+    const intelTasks: Promise<void>[] = [];
 
     // Prices are the baseline
-    marketData.prices = await bitmexService.getPrices(config.equities);
+    intelTasks.push(
+      bitmexService.getPrices(config.equities).then((prices) => { marketData.prices = prices; })
+    );
 
     if (config.dataSources.whale?.enabled) {
       const weight = config.dataSources.whale.weight || 1.0;
       console.log(`   → Tracking Whales (Weight: ${weight})...`);
       const minAmount = parseInt(config.dataSources.whale.minAmount) || 1000000;
-      marketData.whale = await whaleService.getWhaleActivity(minAmount, weight);
+      intelTasks.push(
+        whaleService.getWhaleActivity(minAmount, weight).then((whale) => { marketData.whale = whale; })
+      );
     }
 
     if (config.dataSources.sentiment?.enabled) {
       const weight = config.dataSources.sentiment.weight || 1.0;
       console.log(`   → Analyzing Sentiment (Weight: ${weight})...`);
-      marketData.sentiment = await sentimentService.analyzeSentiment(config.equities, weight);
+      intelTasks.push(
+        sentimentService.analyzeSentiment(config.equities, weight).then((sentiment) => { marketData.sentiment = sentiment; })
+      );
     }
 
     if (config.dataSources.news?.enabled) {
       const weight = config.dataSources.news.weight || 1.0;
       console.log(`   → Scanning News (Weight: ${weight})...`);
-      marketData.news = await newsService.getNews(config.dataSources.news.filter, weight);
+      intelTasks.push(
+        newsService.getNews(config.dataSources.news.filter, weight).then((news) => { marketData.news = news; })
+      );
     }
 
+    // Sources are independent of each other, so fetch them concurrently
+    await Promise.all(intelTasks);
+
     // 3. AI PORTFOLIO ALLOCATION
     console.log('\n🤖 Calculating allocation matrix...');
     const portfolioInput: PortfolioAnalyzerInput = {
@@ -22,31 +22,58 @@ function validateWeight(weight: any): number {
   return Math.round(w);
 }
 
+// Data node parsers keyed by node type
+// (a Map, so node types from the request body can't resolve to Object.prototype members)
+const DATA_SOURCE_PARSERS = new Map<string, (node: any, dataSources: WorkflowConfig['dataSources']) => void>([
+  ['data.whale', (node, dataSources) => {
+    dataSources.whale = {
+      enabled: true,
+      minAmount: node.data?.minAmount || '1000000',
+      weight: validateWeight(node.data?.weight || 50),
+    };
+  }],
+  ['data.sentiment', (node, dataSources) => {
+    dataSources.sentiment = {
+      enabled: true,
+      source: node.data?.source || 'all',
+      weight: validateWeight(node.data?.weight || 50),
+    };
+  }],
+  ['data.news', (node, dataSources) => {
+    dataSources.news = {
+      enabled: true,
+      filter: node.data?.filter || 'all',
+      weight: validateWeight(node.data?.weight || 50),
+    };
+  }],
+]);
+
 // Helper: Parse workflow config from nodes/edges
 function parseWorkflowConfig(nodes: any[], edges: any[]): WorkflowConfig {
-  // Find AI node
-  const aiNode = nodes.find((n) => n.type === 'ai.trader');
+  // Index edge sources by target handle in a single pass
+  const dataNodeIds = new Set<string>();
+  const equityNodeIds = new Set<string>();
+  for (const e of edges) {
+    if (e.targetHandle === 'data_in') dataNodeIds.add(e.source);
+    else if (e.targetHandle === 'equities_in') equityNodeIds.add(e.source);
+  }
+
+  // Find AI node and connected data/equity nodes in a single pass
+  let aiNode: any;
+  const dataNodes: any[] = [];
+  const equityNodes: any[] = [];
+  for (const n of nodes) {
+    if (!aiNode && n.type === 'ai.trader') aiNode = n;
+    if (dataNodeIds.has(n.id)) dataNodes.push(n);
+    if (equityNodeIds.has(n.id)) equityNodes.push(n);
+  }
 
   // Get model and strategy from AI node
   const model = 'grok-4';
   const strategy = aiNode?.data?.strategy || 'balanced';
 
-  // Find connected data nodes
-  const dataNodeIds = edges
-    .filter((e) => e.targetHandle === 'data_in')
-    .map((e) => e.source);
-
-  const dataNodes = nodes.filter((n) => dataNodeIds.includes(n.id));
-
-  // Find connected equity nodes
-  const equityNodeIds = edges
-    .filter((e) => e.targetHandle === 'equities_in')
-    .map((e) => e.source);
-
-  const equityNodes = nodes.filter((n) => equityNodeIds.includes(n.id));
-
   // Parse data sources WITH WEIGHTS
-  const dataSources = {
+  const dataSources: WorkflowConfig['dataSources'] = {
     whale: { 
       enabled: false, 
       minAmount: '1000000',
@@ -65,25 +92,7 @@ function parseWorkflowConfig(nodes: any[], edges: any[]): WorkflowConfig {
   };
 
   for (const node of dataNodes) {
-    if (node.type === 'data.whale') {
-      dataSources.whale = {
-        enabled: true,
-        minAmount: node.data?.minAmount || '1000000',
-        weight: validateWeight(node.data?.weight || 50),
-      };
-    } else if (node.type === 'data.sentiment') {
-      dataSources.sentiment = {
-        enabled: true,
-        source: node.data?.source || 'all',
-        weight: validateWeight(node.data?.weight || 50),
-      };
-    } else if (node.type === 'data.news') {
-      dataSources.news = {
-        enabled: true,
-        filter: node.data?.filter || 'all',
-        weight: validateWeight(node.data?.weight || 50),
-      };
-    }
+    DATA_SOURCE_PARSERS.get(node.type)?.(node, dataSources);
   }
 
   // Parse equities
@@ -73,6 +73,16 @@ export interface TradeResult {
   error?: string;
 }
 
+// Map a BitMEX instrument row to PriceData
+function toPriceData(symbol: string, data: any): PriceData {
+  return {
+    symbol,
+    price: data.lastPrice || 0,
+    change24h: data.lastChangePcnt ? data.lastChangePcnt * 100 : 0,
+    volume24h: data.volume24h || 0,
+  };
+}
+
 // Get current price for a symbol
 export async function getPrice(symbol: string): Promise<PriceData> {
   const bitmexSymbol = toBitmexSymbol(symbol);
@@ -90,12 +100,7 @@ export async function getPrice(symbol: string): Promise<PriceData> {
       throw new Error(`No data for symbol ${bitmexSymbol}`);
     }
 
-    return {
-      symbol,
-      price: data.lastPrice || 0,
-      change24h: data.lastChangePcnt ? data.lastChangePcnt * 100 : 0,
-      volume24h: data.volume24h || 0,
-    };
+    return toPriceData(symbol, data);
   } catch (error: any) {
     console.error(`Error fetching price for ${symbol}:`, error.message);
     return {
@@ -110,11 +115,38 @@ export async function getPrice(symbol: string): Promise<PriceData> {
 // Get prices for multiple symbols
 export async function getPrices(symbols: string[]): Promise<Record<string, PriceData>> {
   const prices: Record<string, PriceData> = {};
+  const uniqueSymbols = [...new Set(symbols)];
+
+  // Several symbols: one request filtered to just their rows and price columns
+  if (uniqueSymbols.length > 1) {
+    try {
+      const response = await axios.get(`${BASE_URL}/api/v1/instrument`, {
+        params: {
+          filter: JSON.stringify({ symbol: uniqueSymbols.map(toBitmexSymbol) }),
+          columns: 'symbol,lastPrice,lastChangePcnt,volume24h',
+        },
+      });
+      const instruments: Record<string, any> = {};
+      for (const data of response.data) {
+        instruments[data.symbol] = data;
+      }
+
+      for (const symbol of uniqueSymbols) {
+        const data = instruments[toBitmexSymbol(symbol)];
+        if (data) prices[symbol] = toPriceData(symbol, data);
+      }
+    } catch (error: any) {
+      console.error('Error fetching instruments:', error.message);
+    }
+  }
 
+  // Fall back to per-symbol lookups for anything the batch request missed
   await Promise.all(
-    symbols.map(async (symbol) => {
-      prices[symbol] = await getPrice(symbol);
-    })
+    uniqueSymbols
+      .filter((symbol) => !prices[symbol])
+      .map(async (symbol) => {
+        prices[symbol] = await getPrice(symbol);
+      })
   );
 
   return prices;
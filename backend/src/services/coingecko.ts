@@ -11,6 +11,25 @@ const SYMBOL_TO_ID: Record<string, string> = {
   XRPUSDT: 'ripple',
 };
 
+// Market-wide stats move slowly and both endpoints are rate limited, so responses are reused briefly
+const GLOBAL_TTL_MS = 60 * 1000; // 1 minute
+const FEAR_GREED_TTL_MS = 10 * 60 * 1000; // 10 minutes, index updates daily
+const responseCache = new Map<string, { value: unknown; cachedAt: number }>();
+
+// Return a fresh cached value for key, or run fetcher and cache a non-null result
+async function withCache<T>(key: string, ttlMs: number, fetcher: () => Promise<T | null>): Promise<T | null> {
+  const hit = responseCache.get(key);
+  if (hit && Date.now() - hit.cachedAt < ttlMs) {
+    return hit.value as T;
+  }
+
+  const value = await fetcher();
+  if (value !== null) {
+    responseCache.set(key, { value, cachedAt: Date.now() });
+  }
+  return value;
+}
+
 export interface CoinData {
   id: string;
   symbol: string;
@@ -68,36 +87,40 @@ export async function getCoinData(symbol: string): Promise<CoinData | null> {
 
 // Get global market data
 export async function getGlobalMarketData(): Promise<GlobalMarketData | null> {
-  try {
-    const response = await axios.get(`${BASE_URL}/global`);
-    const data = response.data.data;
+  return withCache('global', GLOBAL_TTL_MS, async () => {
+    try {
+      const response = await axios.get(`${BASE_URL}/global`);
+      const data = response.data.data;
 
-    return {
-      totalMarketCap: data.total_market_cap.usd,
-      totalVolume: data.total_volume.usd,
-      btcDominance: data.market_cap_percentage.btc,
-      marketCapChangePercentage24h: data.market_cap_change_percentage_24h_usd,
-    };
-  } catch (error: any) {
-    console.error('CoinGecko global data error:', error.message);
-    return null;
-  }
+      return {
+        totalMarketCap: data.total_market_cap.usd,
+        totalVolume: data.total_volume.usd,
+        btcDominance: data.market_cap_percentage.btc,
+        marketCapChangePercentage24h: data.market_cap_change_percentage_24h_usd,
+      };
+    } catch (error: any) {
+      console.error('CoinGecko global data error:', error.message);
+      return null;
+    }
+  });
 }
 
 // Get fear & greed index (from alternative API)
 export async function getFearGreedIndex(): Promise<{ value: number; classification: string } | null> {
-  try {
-    const response = await axios.get('https://api.alternative.me/fng/');
-    const data = response.data.data[0];
+  return withCache('fearGreed', FEAR_GREED_TTL_MS, async () => {
+    try {
+      const response = await axios.get('https://api.alternative.me/fng/');
+      const data = response.data.data[0];
 
-    return {
-      value: parseInt(data.value),
-      classification: data.value_classification,
-    };
-  } catch (error: any) {
-    console.error('Fear & Greed index error:', error.message);
-    return null;
-  }
+      return {
+        value: parseInt(data.value),
+        classification: data.value_classification,
+      };
+    } catch (error: any) {
+      console.error('Fear & Greed index error:', error.message);
+      return null;
+    }
+  });
 }
 
 export const coingeckoService = {
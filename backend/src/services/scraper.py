@@ -18,11 +18,24 @@ reddit_username = os.getenv('REDDIT_USERNAME')
 reddit_password = os.getenv('REDDIT_PASSWORD')
 # Virgülle ayrılmış subreddit listesi
 reddit_subreddits = os.getenv('REDDIT_SUBREDDITS', 'CryptoCurrency,SatoshiStreetBets').split(',')
+# Bu kadar eşleşen gönderi bulununca taramayı bırak (geçersiz değerde 10)
+try:
+    reddit_max_matches = int(os.getenv('REDDIT_MAX_MATCHES') or '10')
+except ValueError:
+    reddit_max_matches = 10
+if reddit_max_matches < 1:
+    reddit_max_matches = 10
 
 telegram_api_id = os.getenv('TELEGRAM_API_ID')
 telegram_api_hash = os.getenv('TELEGRAM_API_HASH')
 # Virgülle ayrılmış kanal listesi (örn: @Bitcoin,@CryptoSignals)
 telegram_channels = os.getenv('TELEGRAM_CHANNELS', '').split(',')
+# Aynı anda sorgulanacak en fazla kanal sayısı
+TELEGRAM_CONCURRENCY = 4
+
+def build_symbol_pattern(symbols):
+    """Tüm semboller için tek seferde derlenen, word boundary'li alternation regex'i döner."""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(s) for s in symbols) + r')\b', re.IGNORECASE)
 
 def scrape_reddit(symbols):
     """Reddit'ten son gönderileri çeker ve ham metin listesi döner."""
@@ -40,6 +53,9 @@ def scrape_reddit(symbols):
         )
         
         texts = []
+        # Döngü içinde attribute lookup yapmamak için local'e bağla
+        append = texts.append
+        search = build_symbol_pattern(symbols).search
         # Birden fazla subreddit'i birleştir (örn: CryptoCurrency+Bitcoin)
         sub_string = "+".join([s.strip().replace('r/', '') for s in reddit_subreddits])
         subreddit = reddit.subreddit(sub_string)
@@ -48,8 +64,12 @@ def scrape_reddit(symbols):
         for post in subreddit.new(limit=50): 
             combined_text = f"{post.title} {post.selftext}"
             # Regex ile sembol kontrolü: word boundary kullanarak tam eşleşme
-            if any(re.search(r'\b' + re.escape(s) + r'\b', combined_text, re.IGNORECASE) for s in symbols):
-                texts.append(combined_text)
+            if search(combined_text):
+                append(combined_text)
+                # Yeterli eşleşme toplandı: kalan gönderilerin regex taramasını atla
+                # (limit=50 tek listing isteği, yani kazanç sadece CPU)
+                if len(texts) >= reddit_max_matches:
+                    break
                 
         return texts
     except Exception as e:
@@ -65,19 +85,30 @@ async def scrape_telegram(symbols):
         client = TelegramClient('tradecraft_session', int(telegram_api_id), telegram_api_hash)
         await client.start()
         
-        texts = []
-        for channel in telegram_channels:
-            if not channel: continue
-            try:
-                # Son 30 mesajı kontrol et
-                async for message in client.iter_messages(channel.strip(), limit=30):
-                    if message.text and any(re.search(r'\b' + re.escape(s) + r'\b', message.text, re.IGNORECASE) for s in symbols):
-                        texts.append(message.text)
-            except Exception:
-                continue
-            # Flood koruması için kanal arası bekleme
-            await asyncio.sleep(0.5)
-                
+        search = build_symbol_pattern(symbols).search
+        # Flood koruması: aynı anda en fazla TELEGRAM_CONCURRENCY kanal sorgulanır
+        sem = asyncio.Semaphore(TELEGRAM_CONCURRENCY)
+
+        async def fetch_channel(channel):
+            channel_texts = []
+            append = channel_texts.append
+            async with sem:
+                try:
+                    # Son 30 mesajı kontrol et
+                    async for message in client.iter_messages(channel.strip(), limit=30):
+                        text = message.text
+                        if text and search(text):
+                            append(text)
+                except Exception:
+                    return channel_texts
+                # Flood koruması için kanal arası bekleme
+                await asyncio.sleep(0.5)
+            return channel_texts
+
+        # Kanalları paralel çek, sonuçları kanal sırasıyla birleştir
+        results = await asyncio.gather(*[fetch_channel(c) for c in telegram_channels if c])
+        texts = [text for channel_texts in results for text in channel_texts]
+
         await client.disconnect()
         return texts
     except Exception:
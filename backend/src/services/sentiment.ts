@@ -6,6 +6,10 @@ import { coingeckoService } from './coingecko';
 // --- Configuration & Setup ---
 const sentimentAnalyzer = new Sentiment();
 const SCRAPER_TIMEOUT_MS = 30000; // 30 second safety net
+const SOCIAL_DATA_TTL_MS = 5 * 60 * 1000; // 5 minutes
+
+// Scraper results keyed by symbol set, so workflows in the same run share one scraper process
+const socialDataCache = new Map<string, { texts: Promise<string[]>; cachedAt: number }>();
 
 export interface SentimentData {
   score: number; // 0-100 normalized global score
@@ -75,6 +79,26 @@ async function fetchRawSocialData(symbols: string[]): Promise<string[]> {
   });
 }
 
+/**
+ * Returns recent scraper output for these symbols, spawning the scraper only on a cache miss.
+ * Concurrent callers share the in-flight request; empty results are not kept.
+ */
+function getRawSocialData(symbols: string[]): Promise<string[]> {
+  const key = [...symbols].sort().join(',');
+  const cached = socialDataCache.get(key);
+  if (cached && Date.now() - cached.cachedAt < SOCIAL_DATA_TTL_MS) {
+    return cached.texts;
+  }
+
+  const entry = { texts: fetchRawSocialData(symbols), cachedAt: Date.now() };
+  socialDataCache.set(key, entry);
+  entry.texts.then((texts) => {
+    if (texts.length === 0 && socialDataCache.get(key) === entry) socialDataCache.delete(key);
+  });
+
+  return entry.texts;
+}
+
 /**
  * Analyzes raw text arrays and produces a 0-100 score.
  */
@@ -109,7 +133,7 @@ export async function analyzeSentiment(symbols: string[], weight: number = 1): P
   const [fearGreed, globalData, rawTexts] = await Promise.all([
     coingeckoService.getFearGreedIndex(),
     coingeckoService.getGlobalMarketData(),
-    fetchRawSocialData(symbols)
+    getRawSocialData(symbols)
   ]);
 
   // 2. Analyze social media sentiment
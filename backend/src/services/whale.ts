@@ -1,4 +1,5 @@
 import axios from 'axios';
+import crypto from 'crypto';
 
 // ---------------------------------------------------------
 // 1. Config & Interfaces
@@ -39,11 +40,8 @@ export interface WhaleActivitySummary {
 const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 
 function generateMockHash(): string {
-  let hash = '0x';
-  for (let i = 0; i < 64; i++) {
-    hash += Math.floor(Math.random() * 16).toString(16);
-  }
-  return hash;
+  // One 32-byte draw instead of 64 Math.random() calls and string appends
+  return '0x' + crypto.randomBytes(32).toString('hex');
 }
 
 function determineTransactionType(fromType: string, toType: string): 'exchange_inflow' | 'exchange_outflow' | 'transfer' {
@@ -65,8 +63,15 @@ function summarizeTransactions(transactions: WhaleTransaction[], weight: number)
     };
   }
 
-  const inflowVol = transactions.filter(t => t.transactionType === 'exchange_inflow').reduce((s, t) => s + t.amountUsd, 0);
-  const outflowVol = transactions.filter(t => t.transactionType === 'exchange_outflow').reduce((s, t) => s + t.amountUsd, 0);
+  // Accumulate inflow, outflow and total volume in a single pass
+  let inflowVol = 0;
+  let outflowVol = 0;
+  let totalVolumeUsd = 0;
+  for (const t of transactions) {
+    totalVolumeUsd += t.amountUsd;
+    if (t.transactionType === 'exchange_inflow') inflowVol += t.amountUsd;
+    else if (t.transactionType === 'exchange_outflow') outflowVol += t.amountUsd;
+  }
 
   // WEIGHT-AWARE: Adjust sensitivity based on weight importance
   // Low weight (25) = require 1.3x difference to signal, High weight (75) = only 1.05x needed
@@ -89,7 +94,7 @@ function summarizeTransactions(transactions: WhaleTransaction[], weight: number)
 
   return {
     totalTransactions: transactions.length,
-    totalVolumeUsd: transactions.reduce((s, t) => s + t.amountUsd, 0),
+    totalVolumeUsd,
     netFlow,
     sentiment,
     largestTransaction: sorted[0] || null,
@@ -40,19 +40,25 @@ export interface WeightInfo {
 
 // --- Internal Helpers ---
 
+// Patterns are compiled once here rather than on every AI response
+const FENCE_RE = /```(?:json)?\n?/g;
+const JSON_OBJECT_RE = /\{[\s\S]*\}/;
+const WHALE_WEIGHT_RE = /Whale[^:]*:\s*(\w+\s+PRIORITY)\s*\((\d+)\)/i;
+const SENTIMENT_WEIGHT_RE = /Sentiment[^:]*:\s*(\w+\s+PRIORITY)\s*\((\d+)\)/i;
+const NEWS_WEIGHT_RE = /News[^:]*:\s*(\w+\s+PRIORITY)\s*\((\d+)\)/i;
+
 /**
  * Ensures the AI response is clean of markdown and parses correctly.
  */
 function parseGrokResponse(content: string): any {
   const cleaned = content
-    .replace(/```json\n?/g, '')
-    .replace(/```\n?/g, '')
+    .replace(FENCE_RE, '')
     .trim();
 
   try {
     return JSON.parse(cleaned);
   } catch {
-    const jsonMatch = cleaned.match(/\{[\s\S]*\}/);
+    const jsonMatch = cleaned.match(JSON_OBJECT_RE);
     if (jsonMatch) {
       try {
         return JSON.parse(jsonMatch[0]);
@@ -70,13 +76,13 @@ function parseGrokResponse(content: string): any {
 function extractWeightContext(prompt: string): WeightInfo {
   const weights: WeightInfo = {};
   
-  const whaleMatch = prompt.match(/Whale[^:]*:\s*(\w+\s+PRIORITY)\s*\((\d+)\)/i);
+  const whaleMatch = prompt.match(WHALE_WEIGHT_RE);
   if (whaleMatch) weights.whale = parseInt(whaleMatch[2]);
   
-  const sentimentMatch = prompt.match(/Sentiment[^:]*:\s*(\w+\s+PRIORITY)\s*\((\d+)\)/i);
+  const sentimentMatch = prompt.match(SENTIMENT_WEIGHT_RE);
   if (sentimentMatch) weights.sentiment = parseInt(sentimentMatch[2]);
   
-  const newsMatch = prompt.match(/News[^:]*:\s*(\w+\s+PRIORITY)\s*\((\d+)\)/i);
+  const newsMatch = prompt.match(NEWS_WEIGHT_RE);
   if (newsMatch) weights.news = parseInt(newsMatch[2]);
   
   return weights;
@@ -89,6 +95,8 @@ function extractWeightContext(prompt: string): WeightInfo {
  * Now includes weight-aware prompting context.
  */
 const GROK_MODEL = 'grok-4';
+// Prompt/weight debug output is opt-in
+const VERBOSE = process.env.TRADECRAFT_VERBOSE === '1';
 
 export async function analyzeMarket(
   _model: string = GROK_MODEL,
@@ -102,12 +110,12 @@ export async function analyzeMarket(
 Always respect the DATA SOURCE WEIGHTING hierarchy provided in the analysis—high-priority sources should override low-priority ones when in conflict.
 Always respond with valid JSON only, following the exact format specified.`;
 
-    // Extract weight info from prompt for logging
-    const weights = extractWeightContext(prompt);
-
     console.log(`\n========== AI MARKET ANALYSIS [${GROK_MODEL}] ==========`);
-    console.log('Data Source Weights:', weights);
-    console.log('User Prompt:', prompt.substring(0, 200) + '...');
+    if (VERBOSE) {
+      // Weight info is only extracted from the prompt when it will be logged
+      console.log('Data Source Weights:', extractWeightContext(prompt));
+      console.log('User Prompt:', prompt.substring(0, 200) + '...');
+    }
 
     const response = await fetch('https://api.x.ai/v1/chat/completions', {
       method: 'POST',
@@ -184,12 +192,12 @@ Key rules:
 - Be strategic—focus capital on the highest confidence opportunities
 - Always respond with valid JSON only, following the exact format specified.`;
 
-    // Extract weight info from prompt for logging
-    const weights = extractWeightContext(prompt);
-
     console.log(`\n========== PORTFOLIO ALLOCATION [${GROK_MODEL}] ==========`);
-    console.log('Data Source Weights:', weights);
-    console.log('User Prompt:', prompt.substring(0, 200) + '...');
+    if (VERBOSE) {
+      // Weight info is only extracted from the prompt when it will be logged
+      console.log('Data Source Weights:', extractWeightContext(prompt));
+      console.log('User Prompt:', prompt.substring(0, 200) + '...');
+    }
 
     const response = await fetch('https://api.x.ai/v1/chat/completions', {
       method: 'POST',